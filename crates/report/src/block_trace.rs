@@ -12,8 +12,8 @@ use alloy::{
 use contender_core::db::{DbOps, RunTx, SpamDuration};
 use contender_core::generator::types::AnyProvider;
 use contender_core::util::get_block_time;
+use futures::StreamExt;
 use serde::{Deserialize, Serialize};
-use std::sync::Arc;
 use tracing::{debug, info, warn};
 
 #[derive(Clone, Debug, Deserialize, Serialize)]
@@ -66,71 +66,55 @@ pub async fn estimate_block_data(
     get_blocks(start_block, end_block, rpc_client).await
 }
 
+/// Maximum number of `eth_getBlockByNumber` requests in flight at once.
+const MAX_CONCURRENT_BLOCK_REQUESTS: usize = 32;
+
 async fn get_blocks(
     min_block: u64,
     max_block: u64,
     rpc_client: &AnyProvider,
 ) -> Result<Vec<AnyRpcBlock>> {
-    // get block data
-    let mut all_blocks: Vec<AnyRpcBlock> = vec![];
-    let (sender, mut receiver) =
-        tokio::sync::mpsc::channel::<AnyRpcBlock>((max_block - min_block) as usize + 1);
-
-    let mut handles = vec![];
-    for block_num in min_block..=max_block {
-        let rpc_client = rpc_client.clone();
-        let sender = sender.clone();
-        let handle = tokio::task::spawn(async move {
+    // stream block data with bounded concurrency, rather than spawning a task
+    // (and reserving a channel slot) for every block in the range up front
+    let all_blocks = futures::stream::iter(min_block..=max_block)
+        .map(|block_num| async move {
             info!("getting block {block_num}...");
-            let block = rpc_client
+            rpc_client
                 .get_block_by_number(block_num.into())
                 .full()
                 .await
-                .expect("failed to get block");
-            if let Some(block) = block {
-                debug!("read block {}", block.header.number);
-                sender.send(block).await.expect("failed to cache block");
-            }
-        });
-        handles.push(handle);
-    }
-    futures::future::join_all(handles).await;
-    receiver.close();
-
-    while let Some(res) = receiver.recv().await {
-        all_blocks.push(res);
-    }
+                .inspect_err(|e| warn!("failed to get block {block_num}: {e}"))
+                .ok()
+                .flatten()
+        })
+        .buffer_unordered(MAX_CONCURRENT_BLOCK_REQUESTS)
+        .filter_map(futures::future::ready)
+        .inspect(|block| debug!("read block {}", block.header.number))
+        .collect::<Vec<_>>()
+        .await;
 
     Ok(all_blocks)
 }
 
 pub async fn get_block_data(txs: &[RunTx], rpc_client: &AnyProvider) -> Result<Vec<AnyRpcBlock>> {
-    // filter out txs with no block number
-    let txs: Vec<RunTx> = txs
-        .iter()
-        .filter(|tx| tx.block_number.is_some())
-        .cloned()
-        .collect();
-
-    if txs.is_empty() {
+    // only block numbers are needed; txs with no block number didn't land
+    let mut block_nums = txs.iter().filter_map(|tx| tx.block_number).peekable();
+
+    if block_nums.peek().is_none() {
         warn!("No landed transactions found. No block data is available.");
         return Ok(vec![]);
     }
 
     // find block range of txs
-    let (min_block, max_block) = txs.iter().fold((u64::MAX, 0), |(min, max), tx| {
-        let bn = tx.block_number.expect("tx has no block number");
-        (min.min(bn), max.max(bn))
-    });
+    let (min_block, max_block) =
+        block_nums.fold((u64::MAX, 0), |(min, max), bn| (min.min(bn), max.max(bn)));
 
     // pad block range on each side
     let block_padding = 3;
     let min_block = min_block.saturating_sub(block_padding);
     let max_block = max_block.saturating_add(block_padding);
 
-    let rpc_client = Arc::new(rpc_client.clone());
-
-    get_blocks(min_block, max_block, &rpc_client).await
+    get_blocks(min_block, max_block, rpc_client).await
 }
 
 pub async fn get_block_traces(
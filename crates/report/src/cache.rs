@@ -1,3 +1,4 @@
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
 
 use super::block_trace::TxTraceReceipt;
@@ -28,16 +29,27 @@ impl CacheFile {
     }
 
     pub fn load(data_dir: impl AsRef<Path>) -> Result<Self> {
-        let file = std::fs::File::open(cache_path(data_dir.as_ref()))?;
-        let cache_data: CacheFile = serde_json::from_reader(file)?;
+        // read the whole file up front; `from_slice` is much faster than
+        // `from_reader`, which parses byte-by-byte through the io::Read impl.
+        let bytes = std::fs::read(cache_path(data_dir.as_ref()))?;
+        let cache_data: CacheFile = serde_json::from_slice(&bytes)?;
         Ok(cache_data)
     }
 
     pub fn save(&self) -> Result<()> {
-        let file = std::fs::File::create(cache_path(&self.data_dir))?;
-        serde_json::to_writer(file, self)?;
+        self.write_to_disk()?;
         Ok(())
     }
+
+    /// Writes the cache file, returning a plain [`std::io::Result`] so it can be
+    /// run on a separate thread (serialization errors are reported as io errors).
+    pub(crate) fn write_to_disk(&self) -> std::io::Result<()> {
+        // buffer writes; serde_json otherwise issues a syscall per token
+        let file = std::fs::File::create(cache_path(&self.data_dir))?;
+        let mut writer = BufWriter::new(file);
+        serde_json::to_writer(&mut writer, self)?;
+        writer.flush()
+    }
 }
 
 /// Returns the fully-qualified path to the cache file.
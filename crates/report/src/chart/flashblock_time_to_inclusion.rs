@@ -1,3 +1,4 @@
+use crate::util::bucket_counts;
 use contender_core::db::RunTx;
 use serde::{Deserialize, Serialize};
 
@@ -28,43 +29,22 @@ impl FlashblockTimeToInclusionChart {
     }
 
     pub fn echart_data(&self) -> FlashblockTimeToInclusionData {
-        let mut buckets = vec![];
-        let mut counts = vec![];
-        let mut max_count = 0;
-
         // 100ms per bucket
         let bucket_size_ms = 100;
-        for &latency_ms in &self.latencies_ms {
-            let bucket_index = (latency_ms / bucket_size_ms) as usize;
-            if bucket_index >= buckets.len() {
-                buckets.resize(bucket_index + 1, "".to_string());
-                counts.resize(bucket_index + 1, 0);
-            }
-            counts[bucket_index] += 1;
-            if counts[bucket_index] > max_count {
-                max_count = counts[bucket_index];
-            }
-            let lo = bucket_index as u64 * bucket_size_ms;
-            let hi = lo + bucket_size_ms;
-            buckets[bucket_index] = format!("{lo} - {hi} ms");
-        }
+        let mut counts = bucket_counts(self.latencies_ms.iter().copied(), bucket_size_ms);
+        let max_count = counts.iter().copied().max().unwrap_or(0);
 
         // Keep the contiguous range from the first to last populated bucket,
         // preserving interior empty buckets so the histogram x-axis is continuous.
-        let first = counts.iter().position(|&c| c > 0);
-        let last = counts.iter().rposition(|&c| c > 0);
-        if let (Some(first), Some(last)) = (first, last) {
-            // Label any interior empty buckets that were never visited
-            for (i, bucket) in buckets.iter_mut().enumerate().take(last + 1).skip(first) {
-                if bucket.is_empty() {
-                    let lo = i as u64 * bucket_size_ms;
-                    let hi = lo + bucket_size_ms;
-                    *bucket = format!("{lo} - {hi} ms");
-                }
-            }
-            buckets = buckets[first..=last].to_vec();
-            counts = counts[first..=last].to_vec();
-        }
+        let first = counts.iter().position(|&c| c > 0).unwrap_or(counts.len());
+        counts.drain(..first);
+        let buckets = (first..first + counts.len())
+            .map(|i| {
+                let lo = i as u64 * bucket_size_ms;
+                let hi = lo + bucket_size_ms;
+                format!("{lo} - {hi} ms")
+            })
+            .collect();
 
         FlashblockTimeToInclusionData {
             buckets,
@@ -1,10 +1,11 @@
 use alloy::network::AnyRpcBlock;
 use serde::{Deserialize, Serialize};
-use std::collections::BTreeMap;
 
 pub struct GasPerBlockChart {
-    /// Maps `block_num` to `gas_used`
-    gas_used_per_block: BTreeMap<u64, u64>,
+    /// Block numbers in ascending order.
+    block_nums: Vec<u64>,
+    /// `gas_used` of the block at the same index in `block_nums`.
+    gas_used: Vec<u64>,
 }
 
 #[derive(Clone, Debug, Deserialize, Serialize)]
@@ -16,32 +17,26 @@ pub struct GasPerBlockData {
 
 impl GasPerBlockChart {
     pub fn new(blocks: &[AnyRpcBlock]) -> Self {
+        // extract the two columns we need once, ordered by block number
+        let mut rows: Vec<(u64, u64)> = blocks
+            .iter()
+            .map(|block| (block.header.number, block.header.gas_used))
+            .collect();
+        rows.sort_by_key(|(block_num, _)| *block_num);
+        rows.dedup_by_key(|(block_num, _)| *block_num);
+        let (block_nums, gas_used) = rows.into_iter().unzip();
+
         Self {
-            gas_used_per_block: blocks
-                .iter()
-                .map(|block| (block.header.number, block.header.gas_used))
-                .collect(),
+            block_nums,
+            gas_used,
         }
     }
 
-    fn block_nums(&self) -> Vec<u64> {
-        self.gas_used_per_block.keys().cloned().collect()
-    }
-
-    fn gas_values(&self) -> Vec<u64> {
-        self.gas_used_per_block.values().cloned().collect()
-    }
-
     pub fn echart_data(&self) -> GasPerBlockData {
         GasPerBlockData {
-            blocks: self.block_nums(),
-            gas_used: self.gas_values(),
-            max_gas_used: self
-                .gas_used_per_block
-                .values()
-                .max()
-                .copied()
-                .unwrap_or_default(),
+            blocks: self.block_nums.to_owned(),
+            gas_used: self.gas_used.to_owned(),
+            max_gas_used: self.gas_used.iter().max().copied().unwrap_or_default(),
         }
     }
 }
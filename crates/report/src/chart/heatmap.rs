@@ -2,8 +2,9 @@ use crate::block_trace::TxTraceReceipt;
 use crate::{Error, Result};
 use alloy::hex::ToHexExt;
 use alloy::primitives::FixedBytes;
+use alloy::rpc::types::trace::geth::GethTrace;
 use serde::{Deserialize, Serialize};
-use std::collections::BTreeMap;
+use std::collections::{BTreeMap, HashMap};
 use tracing::warn;
 
 /// Maximum number of cells to render in the heatmap for performance.
@@ -24,36 +25,32 @@ impl TxTraceReceipt {
             .receipt
             .block_number
             .ok_or(Error::ReceiptMissingBlockNum(self.receipt.transaction_hash))?;
-        let trace_frame = self.trace.to_owned().try_into_pre_state_frame().ok();
-        // If the trace frame is None, it means that the preState trace was not found.
+        // If the trace is not a preState frame, it means that the preState trace was not found.
         // This can happen if the target node does not support preState traces.
-        if trace_frame.is_none() {
+        // Borrow the frame rather than cloning the whole trace to inspect it.
+        let GethTrace::PreStateTracer(trace_frame) = &self.trace else {
             // Log a warning and return early
             warn!(
                 "No preState trace frame found for block number {}. This may indicate that the target node does not support preState traces.",
                 block_num
             );
             return Ok(());
-        }
-        let trace_frame = trace_frame.expect("trace frame should be Some");
+        };
         let account_map = &trace_frame
             .as_default()
-            .ok_or(Error::DecodePrestateTraceFrame(trace_frame.to_owned()))?
+            .ok_or_else(|| Error::DecodePrestateTraceFrame(trace_frame.to_owned()))?
             .0;
 
         // "for each account in this transaction trace"
         for update in account_map.values() {
+            if update.storage.is_empty() {
+                continue;
+            }
             // for every storage slot in this frame, increment the count for the slot at this block number
-            update.storage.iter().for_each(|(slot, _)| {
-                if let Some(slot_map) = updates_per_slot_per_block.get_mut(&block_num) {
-                    let value = slot_map.get(slot).map(|v| v + 1).unwrap_or(1);
-                    slot_map.insert(*slot, value);
-                } else {
-                    let mut slot_map = BTreeMap::new();
-                    slot_map.insert(*slot, 1);
-                    updates_per_slot_per_block.insert(block_num, slot_map);
-                }
-            });
+            let slot_map = updates_per_slot_per_block.entry(block_num).or_default();
+            for slot in update.storage.keys() {
+                *slot_map.entry(*slot).or_default() += 1;
+            }
         }
         Ok(())
     }
@@ -90,13 +87,8 @@ impl HeatMapChart {
         self.updates_per_slot_per_block.keys().cloned().collect()
     }
 
-    fn get_slot_map(&self, block_num: u64) -> Option<&BTreeMap<FixedBytes<32>, u64>> {
-        self.updates_per_slot_per_block.get(&block_num)
-    }
-
     pub fn echart_data(&self) -> HeatmapData {
         let all_blocks = self.get_block_numbers();
-        let all_slots = self.get_hex_slots();
 
         // Condense blocks if there are too many
         let (blocks, block_bucket_size) = if all_blocks.len() > MAX_BLOCKS {
@@ -107,23 +99,21 @@ impl HeatMapChart {
                 .collect();
             (condensed, bucket_size)
         } else {
-            (all_blocks.clone(), 1)
+            (all_blocks, 1)
         };
 
+        // Total access count for each slot across all blocks, in a single pass.
+        // Keys are sorted, so this also gives us every slot in ascending order.
+        let mut slot_totals: BTreeMap<FixedBytes<32>, u64> = BTreeMap::new();
+        for slot_map in self.updates_per_slot_per_block.values() {
+            for (slot, count) in slot_map {
+                *slot_totals.entry(*slot).or_default() += count;
+            }
+        }
+
         // Condense slots if there are too many - keep the most active ones
-        let slots: Vec<FixedBytes<32>> = if all_slots.len() > MAX_SLOTS {
-            // Calculate total access count for each slot across all blocks
-            let mut slot_counts: Vec<(FixedBytes<32>, u64)> = all_slots
-                .iter()
-                .map(|slot| {
-                    let total: u64 = self
-                        .updates_per_slot_per_block
-                        .values()
-                        .filter_map(|slot_map| slot_map.get(slot))
-                        .sum();
-                    (*slot, total)
-                })
-                .collect();
+        let slots: Vec<FixedBytes<32>> = if slot_totals.len() > MAX_SLOTS {
+            let mut slot_counts: Vec<(FixedBytes<32>, u64)> = slot_totals.into_iter().collect();
 
             // Sort by access count descending and take top MAX_SLOTS
             slot_counts.sort_by_key(|a| std::cmp::Reverse(a.1));
@@ -135,32 +125,35 @@ impl HeatMapChart {
             top_slots.sort();
             top_slots
         } else {
-            all_slots
+            slot_totals.into_keys().collect()
         };
 
+        // Map each kept slot to a dense column index, then sum accesses into a
+        // flat (block bucket x slot) grid with one pass over the access map.
+        let slot_index: HashMap<FixedBytes<32>, usize> = slots
+            .iter()
+            .enumerate()
+            .map(|(j, slot)| (*slot, j))
+            .collect();
+        let mut grid = vec![0u64; blocks.len() * slots.len()];
+        for (block_idx, slot_map) in self.updates_per_slot_per_block.values().enumerate() {
+            let row = (block_idx / block_bucket_size) * slots.len();
+            for (slot, count) in slot_map {
+                if let Some(j) = slot_index.get(slot) {
+                    grid[row + j] += count;
+                }
+            }
+        }
+
         let mut matrix = vec![];
         let mut max_accesses = 0;
-
-        for (i, block_start_idx) in (0..all_blocks.len()).step_by(block_bucket_size).enumerate() {
-            let block_end_idx = (block_start_idx + block_bucket_size).min(all_blocks.len());
-            let bucket_blocks = &all_blocks[block_start_idx..block_end_idx];
-
-            for (j, slot) in slots.iter().enumerate() {
-                // Sum accesses across all blocks in this bucket
-                let count: u64 = bucket_blocks
-                    .iter()
-                    .filter_map(|block| {
-                        self.get_slot_map(*block)
-                            .and_then(|slot_map| slot_map.get(slot))
-                    })
-                    .sum();
-
-                if count > max_accesses {
-                    max_accesses = count;
-                }
-                if count > 0 {
-                    matrix.push([i as u64, j as u64, count]);
-                }
+        for (cell, &count) in grid.iter().enumerate() {
+            if count > max_accesses {
+                max_accesses = count;
+            }
+            if count > 0 {
+                let (i, j) = (cell / slots.len(), cell % slots.len());
+                matrix.push([i as u64, j as u64, count]);
             }
         }
 
@@ -171,21 +164,6 @@ impl HeatMapChart {
             max_accesses,
         }
     }
-
-    /// returns all slots in the heatmap
-    fn get_hex_slots(&self) -> Vec<FixedBytes<32>> {
-        let mut slots = self
-            .updates_per_slot_per_block
-            .values()
-            .flat_map(|slot_map| slot_map.keys())
-            // filter out duplicates
-            .collect::<std::collections::HashSet<_>>()
-            .into_iter()
-            .map(|h| h.to_owned())
-            .collect::<Vec<_>>();
-        slots.sort();
-        slots
-    }
 }
 
 #[cfg(test)]
@@ -274,4 +252,29 @@ mod tests {
             );
         }
     }
+
+    #[test]
+    fn test_echart_data_condenses_blocks() {
+        // 150 blocks (more than MAX_BLOCKS = 100) each touching the same slot once
+        // should be condensed into 75 buckets of 2 blocks each.
+        let slot = FixedBytes::<32>::ZERO;
+        let updates_per_slot_per_block = (0..150u64)
+            .map(|block| (block, BTreeMap::from([(slot, 1)])))
+            .collect();
+        let chart = HeatMapChart {
+            updates_per_slot_per_block,
+        };
+
+        let heatmap_data = chart.echart_data();
+
+        assert_eq!(heatmap_data.blocks.len(), 75);
+        assert_eq!(heatmap_data.blocks[1], 2);
+        assert_eq!(heatmap_data.slots, vec![slot.encode_hex()]);
+        assert_eq!(heatmap_data.matrix.len(), 75);
+        assert!(heatmap_data
+            .matrix
+            .iter()
+            .all(|cell| cell[1] == 0 && cell[2] == 2));
+        assert_eq!(heatmap_data.max_accesses, 2);
+    }
 }
@@ -25,18 +25,32 @@ impl PendingTxsChart {
             });
 
         // find pending txs for each second, with 1s padding
-        for t in min_timestamp_s.saturating_sub(1)..max_timestamp_s + 1 {
-            let t_ms = t * 1000;
-            let t_ms_end = t_ms + 1000;
-            let pending_txs = run_txs
-                .iter()
-                .filter(|tx| {
-                    let start_ms = tx.start_timestamp_ms;
-                    let end_ms = tx.end_timestamp_ms.unwrap_or(u64::MAX);
-                    start_ms < t_ms_end && t_ms < end_ms
-                })
-                .count() as u64;
-            pending_txs_per_second.insert(t, pending_txs);
+        let first_s = min_timestamp_s.saturating_sub(1);
+        if first_s <= max_timestamp_s {
+            let num_seconds = (max_timestamp_s - first_s + 1) as usize;
+
+            // A tx is pending during every second in [start_s, ceil(end_ms / 1000)).
+            // Mark where each tx's window opens and closes, then take a running sum
+            // so the whole chart is built in O(txs + seconds).
+            let mut deltas = vec![0i64; num_seconds + 1];
+            for tx in run_txs {
+                let open_s = tx.start_timestamp_ms / 1000;
+                let close_s = tx
+                    .end_timestamp_ms
+                    .map_or(u64::MAX, |end_ms| end_ms.div_ceil(1000))
+                    .min(max_timestamp_s + 1);
+                if close_s <= open_s {
+                    continue;
+                }
+                deltas[(open_s - first_s) as usize] += 1;
+                deltas[(close_s - first_s) as usize] -= 1;
+            }
+
+            let mut pending_txs = 0;
+            for (i, delta) in deltas[..num_seconds].iter().enumerate() {
+                pending_txs += delta;
+                pending_txs_per_second.insert(first_s + i as u64, pending_txs as u64);
+            }
         }
 
         Self {
@@ -59,3 +73,50 @@ impl PendingTxsChart {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use alloy::primitives::TxHash;
+
+    fn make_tx(start_ms: u64, end_ms: Option<u64>) -> RunTx {
+        RunTx {
+            tx_hash: TxHash::ZERO,
+            start_timestamp_ms: start_ms,
+            end_timestamp_ms: end_ms,
+            block_number: end_ms.map(|_| 1),
+            gas_used: Some(21000),
+            kind: None,
+            error: None,
+            flashblock_latency_ms: None,
+            flashblock_index: None,
+        }
+    }
+
+    #[test]
+    fn counts_overlapping_txs_per_second() {
+        // tx A pending during seconds 1-2, tx B pending during seconds 2-3
+        let txs = vec![make_tx(1_000, Some(2_500)), make_tx(2_200, Some(3_100))];
+        let data = PendingTxsChart::new(&txs).echart_data();
+
+        assert_eq!(data.timestamps, vec![0, 1, 2, 3]);
+        assert_eq!(data.pending_txs, vec![0, 1, 2, 1]);
+    }
+
+    #[test]
+    fn unconfirmed_txs_stay_pending() {
+        let txs = vec![make_tx(1_000, Some(3_000)), make_tx(1_500, None)];
+        let data = PendingTxsChart::new(&txs).echart_data();
+
+        assert_eq!(data.timestamps, vec![0, 1, 2, 3]);
+        assert_eq!(data.pending_txs, vec![0, 2, 2, 1]);
+    }
+
+    #[test]
+    fn empty_input() {
+        let data = PendingTxsChart::new(&[]).echart_data();
+
+        assert!(data.timestamps.is_empty());
+        assert!(data.pending_txs.is_empty());
+    }
+}
@@ -1,3 +1,4 @@
+use crate::util::bucket_counts;
 use contender_core::db::RunTx;
 use serde::{Deserialize, Serialize};
 
@@ -17,19 +18,14 @@ pub struct TimeToInclusionData {
 
 impl TimeToInclusionChart {
     pub fn new(run_txs: &[RunTx], bucket_size_ms: u64) -> Self {
-        let mut inclusion_times_ms = vec![];
-        for tx in run_txs {
-            let mut dumb_base = 0;
-            if let Some(end_timestamp_ms) = tx.end_timestamp_ms {
-                // dumb_base prevents underflow in case system time doesn't match block timestamps
-                if dumb_base == 0 && end_timestamp_ms < tx.start_timestamp_ms {
-                    dumb_base += tx.start_timestamp_ms - end_timestamp_ms;
-                }
-                let end_timestamp_ms = end_timestamp_ms + dumb_base;
-                let tti_ms = end_timestamp_ms - tx.start_timestamp_ms;
-                inclusion_times_ms.push(tti_ms);
-            }
-        }
+        let inclusion_times_ms = run_txs
+            .iter()
+            .filter_map(|tx| {
+                // saturate to prevent underflow in case system time doesn't match block timestamps
+                tx.end_timestamp_ms
+                    .map(|end_ms| end_ms.saturating_sub(tx.start_timestamp_ms))
+            })
+            .collect();
         Self {
             inclusion_times_ms,
             bucket_size_ms,
@@ -37,37 +33,27 @@ impl TimeToInclusionChart {
     }
 
     pub fn echart_data(&self) -> TimeToInclusionData {
-        let mut buckets = vec![];
-        let mut counts = vec![];
-        let mut max_count = 0;
-
         let bucket_size_ms = self.bucket_size_ms;
-        for &tti_ms in &self.inclusion_times_ms {
-            let bucket_index = (tti_ms / bucket_size_ms) as usize;
-            if bucket_index >= buckets.len() {
-                buckets.resize(bucket_index + 1, "".to_string());
-                counts.resize(bucket_index + 1, 0);
-            }
-            counts[bucket_index] += 1;
-            if counts[bucket_index] > max_count {
-                max_count = counts[bucket_index];
-            }
-            let start_ms = bucket_index as u64 * bucket_size_ms;
-            let end_ms = start_ms + bucket_size_ms;
-            buckets[bucket_index] = if bucket_size_ms % 1000 == 0 {
-                let start_s = start_ms / 1000;
-                let end_s = end_ms / 1000;
-                format!("{start_s} - {end_s} s")
-            } else {
-                format!("{start_ms} - {end_ms} ms")
-            };
-        }
+        let counts = bucket_counts(self.inclusion_times_ms.iter().copied(), bucket_size_ms);
+        let max_count = counts.iter().copied().max().unwrap_or(0);
 
-        // Filter out empty buckets and counts that are zero
-        (buckets, counts) = buckets
+        // only label non-empty buckets
+        let (buckets, counts) = counts
             .into_iter()
-            .zip(counts)
-            .filter(|(bucket, count)| !bucket.is_empty() && *count > 0)
+            .enumerate()
+            .filter(|(_, count)| *count > 0)
+            .map(|(bucket_index, count)| {
+                let start_ms = bucket_index as u64 * bucket_size_ms;
+                let end_ms = start_ms + bucket_size_ms;
+                let bucket = if bucket_size_ms % 1000 == 0 {
+                    let start_s = start_ms / 1000;
+                    let end_s = end_ms / 1000;
+                    format!("{start_s} - {end_s} s")
+                } else {
+                    format!("{start_ms} - {end_ms} ms")
+                };
+                (bucket, count)
+            })
             .unzip();
 
         TimeToInclusionData {
@@ -118,6 +104,15 @@ mod tests {
         assert_eq!(data.counts, vec![1, 1]);
     }
 
+    #[test]
+    fn end_before_start_saturates_to_zero() {
+        let txs = vec![make_tx(1000, 900), make_tx(1000, 1050)];
+        let data = TimeToInclusionChart::new(&txs, 100).echart_data();
+
+        assert_eq!(data.buckets, vec!["0 - 100 ms"]);
+        assert_eq!(data.counts, vec![2]);
+    }
+
     #[test]
     fn empty_input() {
         let data = TimeToInclusionChart::new(&[], 1000).echart_data();
@@ -1,4 +1,7 @@
-use crate::{block_trace::TxTraceReceipt, util::abbreviate_num};
+use crate::{
+    block_trace::TxTraceReceipt,
+    util::{abbreviate_num, bucket_counts},
+};
 use serde::{Deserialize, Serialize};
 
 pub struct TxGasUsedChart {
@@ -26,31 +29,27 @@ impl TxGasUsedChart {
     }
 
     pub fn echart_data(&self) -> TxGasUsedData {
-        let mut buckets = vec![];
-        let mut counts = vec![];
-        let mut max_count = 0;
+        let counts = bucket_counts(
+            self.gas_used
+                .iter()
+                .map(|&gas| gas + (self.bucket_width - (gas % self.bucket_width))),
+            self.bucket_width,
+        );
+        let max_count = counts.iter().copied().max().unwrap_or(0);
 
-        for &gas in &self.gas_used {
-            let gas = gas + (self.bucket_width - (gas % self.bucket_width));
-            let bucket_index = (gas / self.bucket_width) as usize;
-            if bucket_index >= buckets.len() {
-                buckets.resize(bucket_index + 1, "0".to_string());
-                counts.resize(bucket_index + 1, 0);
-            }
-            counts[bucket_index] += 1;
-            if counts[bucket_index] > max_count {
-                max_count = counts[bucket_index];
-            }
-            buckets[bucket_index] = format!(
-                "{} - {}",
-                abbreviate_num(bucket_index as u64 * self.bucket_width),
-                abbreviate_num((bucket_index + 1) as u64 * self.bucket_width)
-            );
-        }
-        let (buckets, counts): (Vec<_>, Vec<_>) = buckets
+        // only label non-empty buckets
+        let (buckets, counts): (Vec<_>, Vec<_>) = counts
             .into_iter()
-            .zip(counts)
+            .enumerate()
             .filter(|(_, count)| *count != 0)
+            .map(|(bucket_index, count)| {
+                let bucket = format!(
+                    "{} - {}",
+                    abbreviate_num(bucket_index as u64 * self.bucket_width),
+                    abbreviate_num((bucket_index + 1) as u64 * self.bucket_width)
+                );
+                (bucket, count)
+            })
             .unzip();
 
         TxGasUsedData {
@@ -1,6 +1,6 @@
 use super::gen_html::{build_html_report, build_json_report, CampaignMetadata, ReportMetadata};
-use super::util::std_deviation;
-use crate::block_trace::{estimate_block_data, get_block_data, get_block_traces};
+use super::util::{mean, nearest_rank_quantiles, std_deviation};
+use crate::block_trace::{estimate_block_data, get_block_data, get_block_traces, TxTraceReceipt};
 use crate::cache::CacheFile;
 use crate::chart::{
     flashblock_index::FlashblockIndexChart,
@@ -12,10 +12,10 @@ use crate::chart::{
     time_to_inclusion::TimeToInclusionChart,
     tx_gas_used::TxGasUsedChart,
 };
-use crate::gen_html::ChartData;
+use crate::gen_html::{render_to_file, ChartData, CAMPAIGN_TEMPLATE};
 use crate::util::write_run_txs;
 use crate::{Error, Result};
-use alloy::network::AnyNetwork;
+use alloy::network::{AnyNetwork, AnyRpcBlock};
 use alloy::providers::DynProvider;
 use alloy::{providers::ProviderBuilder, transports::http::reqwest::Url};
 use contender_core::buckets::{Bucket, BucketsExt};
@@ -98,9 +98,9 @@ pub async fn report(
 ) -> Result<()> {
     let num_runs = db.num_runs().map_err(|e| e.into())?;
 
-    let data_path = Path::new(data_dir).join("reports");
-    if !data_path.exists() {
-        fs::create_dir_all(data_path)?;
+    let reports_dir = data_dir.join("reports");
+    if !reports_dir.exists() {
+        fs::create_dir_all(&reports_dir)?;
     }
 
     if num_runs == 0 {
@@ -129,11 +129,10 @@ pub async fn report(
     // collect CSV report for each run_id
     let start_run_id = end_run_id - params.preceding_runs;
     let mut all_txs = vec![];
-    let reports_dir = data_dir.join("reports");
     for id in start_run_id..=end_run_id {
         let txs = db.get_run_txs(id).map_err(|e| e.into())?;
-        all_txs.extend_from_slice(&txs);
         save_csv_report(id, &txs, &reports_dir)?;
+        all_txs.extend(txs);
     }
 
     // get run data, filter by rpc_url
@@ -165,16 +164,14 @@ pub async fn report(
             })
     });
     // collect all unique scenario_name values from run_data
+    // and return only the filename without the path and extension
+    let toml_filename = regex::Regex::new(r".*/(.*)\.toml$").unwrap();
     let scenario_names: Vec<String> = run_data
         .iter()
         .map(|run| run.scenario_name.clone())
         .collect::<std::collections::HashSet<_>>()
         .iter()
-        .map(|v| {
-            // return only the filename without the path and extension
-            let re = regex::Regex::new(r".*/(.*)\.toml$").unwrap();
-            re.replace(v, "$1").to_string()
-        })
+        .map(|v| toml_filename.replace(v, "$1").to_string())
         .collect();
     let scenario_title = scenario_names
         .into_iter()
@@ -188,7 +185,7 @@ pub async fn report(
             .network::<AnyNetwork>()
             .connect_http(url),
     );
-    let (trace_data, blocks) = if std::env::var("DEBUG_USEFILE").is_ok() {
+    let (trace_data, mut blocks) = if std::env::var("DEBUG_USEFILE").is_ok() {
         info!("DEBUG_USEFILE detected: using cached data");
         // load trace data from file
         let cache_data = CacheFile::load(data_dir)?;
@@ -209,39 +206,27 @@ pub async fn report(
         };
         (trace_data, block_data)
     };
-
-    // find peak gas usage
-    let peak_gas = blocks.iter().map(|b| b.header.gas_used).max().unwrap_or(0);
+    // blocks arrive in completion order; sort them once so every stat below
+    // (block range, gas limit, block times) can read them in chain order
+    blocks.sort_by_key(|b| b.header.number);
+
+    // find peak gas usage & peak tx count in a single pass
+    let (peak_gas, peak_tx_count) = blocks.iter().fold((0, 0), |(gas, tx_count), b| {
+        (
+            gas.max(b.header.gas_used),
+            tx_count.max(b.transactions.len() as u64),
+        )
+    });
     let gas_quantiles = {
         let mut gas_values: Vec<u128> = blocks.iter().map(|b| b.header.gas_used as u128).collect();
-        gas_values.sort();
-        if gas_values.is_empty() {
-            GasQuantiles {
+        match nearest_rank_quantiles(&mut gas_values, &[0.5, 0.9, 0.95, 0.99]).as_deref() {
+            Some(&[p50, p90, p95, p99]) => GasQuantiles { p50, p90, p95, p99 },
+            _ => GasQuantiles {
                 p50: 0,
                 p90: 0,
                 p95: 0,
                 p99: 0,
-            }
-        } else {
-            let len = gas_values.len();
-            let p50_idx = ((len as f64 * 0.5).ceil() as usize)
-                .saturating_sub(1)
-                .min(len - 1);
-            let p90_idx = ((len as f64 * 0.9).ceil() as usize)
-                .saturating_sub(1)
-                .min(len - 1);
-            let p95_idx = ((len as f64 * 0.95).ceil() as usize)
-                .saturating_sub(1)
-                .min(len - 1);
-            let p99_idx = ((len as f64 * 0.99).ceil() as usize)
-                .saturating_sub(1)
-                .min(len - 1);
-            GasQuantiles {
-                p50: gas_values[p50_idx],
-                p90: gas_values[p90_idx],
-                p95: gas_values[p95_idx],
-                p99: gas_values[p99_idx],
-            }
+            },
         }
     };
     let block_gas_limit = blocks
@@ -249,37 +234,16 @@ pub async fn report(
         .map(|blk| blk.header.gas_limit)
         .unwrap_or(30_000_000);
 
-    // find peak tx count
-    let peak_tx_count = blocks
-        .iter()
-        .map(|b| b.transactions.len())
-        .max()
-        .unwrap_or(0) as u64;
-
-    // find average block time
-    let mut block_timestamps = blocks
-        .iter()
-        .map(|b| b.header.timestamp)
-        .collect::<Vec<_>>();
-    block_timestamps.sort();
-    let average_block_time = block_timestamps
+    // find average block time; timestamps are already in order since blocks are sorted
+    let block_time_deltas = blocks
         .windows(2)
-        .map(|w| w[1] - w[0])
-        .sum::<u64>() as f64
-        / (blocks.len() - 1).max(1) as f64;
-    let block_time_delta_std_dev = std_deviation(
-        &block_timestamps
-            .windows(2)
-            .map(|w| w[1] - w[0])
-            .collect::<Vec<_>>(),
-    );
+        .map(|w| w[1].header.timestamp.saturating_sub(w[0].header.timestamp))
+        .collect::<Vec<_>>();
+    let average_block_time = mean(&block_time_deltas).unwrap_or(0.0);
+    let block_time_delta_std_dev = std_deviation(&block_time_deltas);
     let start_block = blocks.first().map(|b| b.header.number).unwrap_or(0);
     let end_block = blocks.last().map(|b| b.header.number).unwrap_or(0);
 
-    // cache data to file
-    let cache_data = CacheFile::new(trace_data, blocks, data_dir);
-    cache_data.save()?;
-
     // collect latency data for all relevant methods
     let latency_methods = [
         "eth_sendRawTransaction",
@@ -319,8 +283,9 @@ pub async fn report(
 
     let block_time_delta_std_dev = block_time_delta_std_dev.unwrap_or(0.0);
 
-    let total_txs = all_txs.len() as u64;
-    let failed_txs = all_txs.iter().filter(|tx| tx.error.is_some()).count() as u64;
+    let tx_summary = RunTxSummary::new(&all_txs);
+    let total_txs = tx_summary.tx_count;
+    let failed_txs = tx_summary.error_count;
     let successful_txs = total_txs.saturating_sub(failed_txs);
     let failure_rate_desc = if total_txs > 0 {
         Some(format!(
@@ -332,12 +297,7 @@ pub async fn report(
     };
 
     let metrics = SpamRunMetrics {
-        gas_quantiles: GasQuantiles {
-            p50: gas_quantiles.p50,
-            p90: gas_quantiles.p90,
-            p95: gas_quantiles.p95,
-            p99: gas_quantiles.p99,
-        },
+        gas_quantiles,
         peak_gas: MetricDescriptor::new(
             peak_gas,
             Some(&format!("{}%", (peak_gas * 100) / block_gas_limit)),
@@ -372,43 +332,27 @@ pub async fn report(
         failed_txs: MetricDescriptor::new(failed_txs, failure_rate_desc.as_deref()),
     };
 
-    let heatmap = HeatMapChart::new(&cache_data.traces)?;
-    let gas_per_block = GasPerBlockChart::new(&cache_data.blocks);
-    let tti = TimeToInclusionChart::new(&all_txs, params.time_to_inclusion_bucket);
-    let gas_used = TxGasUsedChart::new(&cache_data.traces, 4000);
-    let pending_txs = PendingTxsChart::new(&all_txs);
-    let flashblock_tti = FlashblockTimeToInclusionChart::new(&all_txs);
-    let flashblock_idx = FlashblockIndexChart::new(&all_txs);
-    // Build latency charts for tx-sending methods that have data.
-    // Methods like eth_sendRawTransaction and eth_sendRawTransactionSync get
-    // dedicated latency histogram charts; methods with no data are skipped.
-    let tx_send_methods = ["eth_sendRawTransaction", "eth_sendRawTransactionSync"];
-    let latency_charts: Vec<MethodLatencyData> = tx_send_methods
-        .iter()
-        .filter_map(|method| {
-            let buckets = canonical_latency_map.get(*method)?;
-            let has_data = buckets
-                .last()
-                .map(|b| b.cumulative_count > 0)
-                .unwrap_or(false);
-            if !has_data {
-                return None;
-            }
-            let chart = LatencyChart::new(buckets.to_owned());
-            Some(MethodLatencyData {
-                method: method.to_string(),
-                data: chart.echart_data(),
-            })
-        })
-        .collect();
+    // cache data to file on its own thread while the charts are built;
+    // both only read from `cache_data`, so serialization overlaps with chart work
+    let cache_data = CacheFile::new(trace_data, blocks, data_dir);
+    let chart_data = std::thread::scope(|s| -> Result<ChartData> {
+        let cache_saved = s.spawn(|| cache_data.write_to_disk());
+        let chart_data = build_chart_data(
+            &cache_data.traces,
+            &cache_data.blocks,
+            &all_txs,
+            &canonical_latency_map,
+            params.time_to_inclusion_bucket,
+        )?;
+        join_thread(cache_saved)?;
+        Ok(chart_data)
+    })?;
 
     // compile report
     info!(
         "Generating report (run_ids: {start_run_id}-{end_run_id}) (blocks {} to {})",
         start_block, end_block
     );
-    let mut blocks = cache_data.blocks;
-    blocks.sort_by_key(|a| a.header.number);
     let report_metadata = ReportMetadata {
         scenario_name: scenario_title,
         start_run_id,
@@ -417,21 +361,10 @@ pub async fn report(
         end_block,
         rpc_url: rpc_url.to_string(),
         metrics,
-        chart_data: ChartData {
-            heatmap: heatmap.echart_data(),
-            gas_per_block: gas_per_block.echart_data(),
-            time_to_inclusion: tti.echart_data(),
-            tx_gas_used: gas_used.echart_data(),
-            pending_txs: pending_txs.echart_data(),
-            latency_charts,
-            flashblock_time_to_inclusion: flashblock_tti.map(|c| c.echart_data()),
-            flashblock_index: flashblock_idx.map(|c| c.echart_data()),
-        },
+        chart_data,
         campaign: campaign_context,
     };
 
-    let reports_dir = data_dir.join("reports");
-
     if params.use_json {
         // JSON output - no browser opening
         let report_path = build_json_report(&report_metadata, &reports_dir)?;
@@ -454,6 +387,73 @@ pub async fn report(
     Ok(())
 }
 
+/// Builds the data for every chart in the report.
+///
+/// Charts don't depend on each other, so the tx-based charts are computed on
+/// scoped threads while the trace- and block-based charts run on this one.
+fn build_chart_data(
+    traces: &[TxTraceReceipt],
+    blocks: &[AnyRpcBlock],
+    run_txs: &[RunTx],
+    latency_map: &BTreeMap<String, Vec<Bucket>>,
+    time_to_inclusion_bucket: u64,
+) -> Result<ChartData> {
+    std::thread::scope(|s| -> Result<ChartData> {
+        let pending_txs = s.spawn(|| PendingTxsChart::new(run_txs).echart_data());
+        let time_to_inclusion =
+            s.spawn(|| TimeToInclusionChart::new(run_txs, time_to_inclusion_bucket).echart_data());
+        let flashblock_time_to_inclusion =
+            s.spawn(|| FlashblockTimeToInclusionChart::new(run_txs).map(|c| c.echart_data()));
+        let flashblock_index =
+            s.spawn(|| FlashblockIndexChart::new(run_txs).map(|c| c.echart_data()));
+
+        let heatmap = HeatMapChart::new(traces)?.echart_data();
+        let tx_gas_used = TxGasUsedChart::new(traces, 4000).echart_data();
+        let gas_per_block = GasPerBlockChart::new(blocks).echart_data();
+
+        // Build latency charts for tx-sending methods that have data.
+        // Methods like eth_sendRawTransaction and eth_sendRawTransactionSync get
+        // dedicated latency histogram charts; methods with no data are skipped.
+        let tx_send_methods = ["eth_sendRawTransaction", "eth_sendRawTransactionSync"];
+        let latency_charts: Vec<MethodLatencyData> = tx_send_methods
+            .iter()
+            .filter_map(|method| {
+                let buckets = latency_map.get(*method)?;
+                let has_data = buckets
+                    .last()
+                    .map(|b| b.cumulative_count > 0)
+                    .unwrap_or(false);
+                if !has_data {
+                    return None;
+                }
+                let chart = LatencyChart::new(buckets.to_owned());
+                Some(MethodLatencyData {
+                    method: method.to_string(),
+                    data: chart.echart_data(),
+                })
+            })
+            .collect();
+
+        Ok(ChartData {
+            heatmap,
+            gas_per_block,
+            time_to_inclusion: join_thread(time_to_inclusion),
+            tx_gas_used,
+            pending_txs: join_thread(pending_txs),
+            latency_charts,
+            flashblock_time_to_inclusion: join_thread(flashblock_time_to_inclusion),
+            flashblock_index: join_thread(flashblock_index),
+        })
+    })
+}
+
+/// Joins a report thread, re-raising its panic (if any) on the calling thread.
+fn join_thread<T>(handle: std::thread::ScopedJoinHandle<'_, T>) -> T {
+    handle
+        .join()
+        .unwrap_or_else(|e| std::panic::resume_unwind(e))
+}
+
 /// Saves RunTxs to `{reports_dir}/{id}.csv`.
 fn save_csv_report(id: u64, txs: &[RunTx], reports_dir: &Path) -> Result<()> {
     let out_path = reports_dir.join(format!("{id}.csv"));
@@ -544,8 +544,9 @@ pub async fn report_campaign(
                 .with_last_run_id(run.id);
             report(db, data_dir, params).await?;
             let run_txs = db.get_run_txs(run.id).map_err(|e| e.into())?;
+            let tx_summary = RunTxSummary::new(&run_txs);
             let (run_tx_count_from_logs, run_error_count_from_logs) =
-                tx_and_error_counts(&run_txs, run.tx_count);
+                tx_and_error_counts(&tx_summary, run.tx_count);
             let logs_complete =
                 !run_txs.is_empty() && (run_tx_count_from_logs as usize) >= run.tx_count;
             if !logs_complete {
@@ -564,9 +565,9 @@ pub async fn report_campaign(
             };
 
             let (start_ms, end_ms) = if logs_complete {
-                run_time_bounds(run, &run_txs)
+                run_time_bounds(run, &tx_summary)
             } else {
-                run_time_bounds(run, &[])
+                run_time_bounds(run, &RunTxSummary::default())
             };
 
             overall_acc.add_run(run_tx_count, run_error_count, start_ms, end_ms);
@@ -582,15 +583,10 @@ pub async fn report_campaign(
                 .or_default()
                 .add_run(run_tx_count, run_error_count, start_ms, end_ms);
 
-            let stage_key = run
-                .stage_name
-                .clone()
-                .unwrap_or_else(|| "unspecified-stage".to_string());
-            let scenario_key = run.scenario_name.clone();
             totals
-                .entry(stage_key.clone())
+                .entry(stage_key)
                 .or_default()
-                .entry(scenario_key.clone())
+                .entry(scenario_key)
                 .and_modify(|count| *count += run_tx_count as usize)
                 .or_insert(run_tx_count as usize);
 
@@ -628,8 +624,14 @@ pub async fn report_campaign(
     };
 
     let index_path = data_path.join(format!("campaign-{campaign_id}.html"));
-    let html = render_campaign_html(&summary)?;
-    fs::write(&index_path, html)?;
+    render_to_file(
+        CAMPAIGN_TEMPLATE,
+        &serde_json::json!({
+            "campaign": summary,
+            "version": env!("CARGO_PKG_VERSION")
+        }),
+        &index_path,
+    )?;
 
     let summary_path = data_path.join(format!("campaign-{campaign_id}.json"));
     fs::write(&summary_path, serde_json::to_string_pretty(&summary)?)?;
@@ -644,18 +646,6 @@ pub async fn report_campaign(
     Ok(())
 }
 
-fn render_campaign_html(summary: &CampaignReportSummary) -> Result<String> {
-    let template = include_str!("template_campaign.html.handlebars");
-    let html = handlebars::Handlebars::new().render_template(
-        template,
-        &serde_json::json!({
-            "campaign": summary,
-            "version": env!("CARGO_PKG_VERSION")
-        }),
-    )?;
-    Ok(html)
-}
-
 #[derive(Default)]
 struct OverallAccumulator {
     total_tx: u64,
@@ -761,27 +751,41 @@ fn millis_to_rfc3339(ms: i64) -> String {
     dt.to_rfc3339()
 }
 
-fn tx_and_error_counts(run_txs: &[RunTx], fallback_tx_count: usize) -> (u64, u64) {
-    if run_txs.is_empty() {
+/// Counts and time bounds of a set of txs, gathered in a single pass.
+#[derive(Default)]
+struct RunTxSummary {
+    tx_count: u64,
+    error_count: u64,
+    start_ms: Option<u128>,
+    end_ms: Option<u128>,
+}
+
+impl RunTxSummary {
+    fn new(run_txs: &[RunTx]) -> Self {
+        run_txs.iter().fold(Self::default(), |mut acc, tx| {
+            let start = tx.start_timestamp_ms as u128;
+            let end = tx.end_timestamp_ms.map(|e| e as u128).unwrap_or(start);
+            acc.tx_count += 1;
+            if tx.error.is_some() {
+                acc.error_count += 1;
+            }
+            acc.start_ms = Some(acc.start_ms.map_or(start, |curr| curr.min(start)));
+            acc.end_ms = Some(acc.end_ms.map_or(end, |curr| curr.max(end)));
+            acc
+        })
+    }
+}
+
+fn tx_and_error_counts(summary: &RunTxSummary, fallback_tx_count: usize) -> (u64, u64) {
+    if summary.tx_count == 0 {
         return (fallback_tx_count as u64, 0);
     }
-    let tx_count = run_txs.len() as u64;
-    let error_count = run_txs.iter().filter(|tx| tx.error.is_some()).count() as u64;
-    (tx_count, error_count)
+    (summary.tx_count, summary.error_count)
 }
 
-fn run_time_bounds(run: &SpamRun, run_txs: &[RunTx]) -> (Option<u128>, Option<u128>) {
-    if !run_txs.is_empty() {
-        let start = run_txs.iter().map(|t| t.start_timestamp_ms as u128).min();
-        let end = run_txs
-            .iter()
-            .map(|t| {
-                t.end_timestamp_ms
-                    .map(|e| e as u128)
-                    .unwrap_or(t.start_timestamp_ms as u128)
-            })
-            .max();
-        return (start, end);
+fn run_time_bounds(run: &SpamRun, summary: &RunTxSummary) -> (Option<u128>, Option<u128>) {
+    if summary.tx_count > 0 {
+        return (summary.start_ms, summary.end_ms);
     }
     let start_ms = run.timestamp as u128;
     let duration_ms = if run.duration.is_seconds() {
@@ -7,9 +7,40 @@ use crate::chart::tx_gas_used::TxGasUsedData;
 use crate::chart::{gas_per_block::GasPerBlockData, heatmap::HeatmapData};
 use crate::command::SpamRunMetrics;
 use crate::Result;
+use handlebars::Handlebars;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
+use std::fs::File;
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
+use std::sync::LazyLock;
+
+const REPORT_TEMPLATE: &str = "report";
+const RPC_REPORT_TEMPLATE: &str = "rpc_report";
+pub(crate) const CAMPAIGN_TEMPLATE: &str = "campaign";
+
+/// Handlebars registry with the built-in report templates pre-compiled.
+/// Templates are parsed once and reused for every report rendered by the process,
+/// e.g. each per-run report generated for a campaign.
+pub(crate) static TEMPLATES: LazyLock<Handlebars<'static>> = LazyLock::new(|| {
+    let mut registry = Handlebars::new();
+    for (name, template) in [
+        (REPORT_TEMPLATE, include_str!("template.html.handlebars")),
+        (
+            RPC_REPORT_TEMPLATE,
+            include_str!("template_rpc.html.handlebars"),
+        ),
+        (
+            CAMPAIGN_TEMPLATE,
+            include_str!("template_campaign.html.handlebars"),
+        ),
+    ] {
+        registry
+            .register_template_string(name, template)
+            .expect("built-in report template should be valid");
+    }
+    registry
+});
 
 pub struct ReportMetadata {
     pub scenario_name: String,
@@ -59,16 +90,18 @@ struct TemplateData {
 }
 
 impl TemplateData {
-    pub fn new(meta: &ReportMetadata) -> Self {
+    /// Takes ownership of `meta` so the (potentially large) chart data is moved
+    /// into the template context rather than cloned.
+    pub fn new(meta: ReportMetadata) -> Self {
         Self {
-            scenario_name: meta.scenario_name.to_owned(),
+            scenario_name: meta.scenario_name,
             date: chrono::Local::now().to_rfc2822(),
-            rpc_url: meta.rpc_url.to_owned(),
+            rpc_url: meta.rpc_url,
             start_block: meta.start_block.to_string(),
             end_block: meta.end_block.to_string(),
-            metrics: meta.metrics.to_owned(),
-            chart_data: meta.chart_data.to_owned(),
-            campaign: meta.campaign.to_owned(),
+            metrics: meta.metrics,
+            chart_data: meta.chart_data,
+            campaign: meta.campaign,
             version: env!("CARGO_PKG_VERSION").to_string(),
         }
     }
@@ -124,18 +157,24 @@ impl ReportExportV1 {
     }
 }
 
+/// Renders the named built-in template straight into a file at `path`,
+/// rather than building the whole document as a `String` first.
+pub(crate) fn render_to_file<T: Serialize>(template: &str, data: &T, path: &Path) -> Result<()> {
+    let mut writer = BufWriter::new(File::create(path)?);
+    TEMPLATES.render_to_write(template, data, &mut writer)?;
+    writer.flush()?;
+    Ok(())
+}
+
 /// Builds an HTML report for the given run IDs. Returns the path to the report.
 pub fn build_html_report(meta: ReportMetadata, reports_dir: &Path) -> Result<PathBuf> {
-    let template = include_str!("template.html.handlebars");
+    let filename = format!("report-{}-{}.html", meta.start_run_id, meta.end_run_id);
 
     let mut data = HashMap::new();
-    let template_data = TemplateData::new(&meta);
+    let template_data = TemplateData::new(meta);
     data.insert("data", template_data);
-    let html = handlebars::Handlebars::new().render_template(template, &data)?;
-
-    let filename = format!("report-{}-{}.html", meta.start_run_id, meta.end_run_id);
     let path = reports_dir.join(filename);
-    std::fs::write(&path, html)?;
+    render_to_file(REPORT_TEMPLATE, &data, &path)?;
 
     Ok(path)
 }
@@ -143,11 +182,12 @@ pub fn build_html_report(meta: ReportMetadata, reports_dir: &Path) -> Result<Pat
 /// Builds a JSON report for the given run IDs. Returns the path to the report.
 pub fn build_json_report(meta: &ReportMetadata, reports_dir: &Path) -> Result<PathBuf> {
     let export = ReportExportV1::new(meta);
-    let json = serde_json::to_string_pretty(&export)?;
 
     let filename = format!("report-{}-{}.json", meta.start_run_id, meta.end_run_id);
     let path = reports_dir.join(filename);
-    std::fs::write(&path, json)?;
+    let mut writer = BufWriter::new(File::create(&path)?);
+    serde_json::to_writer_pretty(&mut writer, &export)?;
+    writer.flush()?;
 
     Ok(path)
 }
@@ -187,18 +227,18 @@ struct RpcTemplateData {
 }
 
 impl RpcTemplateData {
-    fn new(meta: &RpcReportMetadata) -> Self {
+    fn new(meta: RpcReportMetadata) -> Self {
         Self {
-            method: meta.method.clone(),
+            method: meta.method,
             date: chrono::Local::now().to_rfc2822(),
-            rpc_url: meta.rpc_url.clone(),
+            rpc_url: meta.rpc_url,
             rps: meta.rps,
             duration_secs: meta.duration_secs,
             total_requests: meta.total_requests,
             success_count: meta.success_count,
             error_count: meta.error_count,
-            latency_quantiles: meta.latency_quantiles.clone(),
-            latency_chart: meta.latency_chart.clone(),
+            latency_quantiles: meta.latency_quantiles,
+            latency_chart: meta.latency_chart,
             version: env!("CARGO_PKG_VERSION").to_string(),
         }
     }
@@ -206,16 +246,25 @@ impl RpcTemplateData {
 
 /// Builds an HTML report for an RPC-only spam run. Returns the path to the report.
 pub fn build_rpc_html_report(meta: RpcReportMetadata, reports_dir: &Path) -> Result<PathBuf> {
-    let template = include_str!("template_rpc.html.handlebars");
+    let filename = format!("rpc-report-{}.html", meta.run_id);
 
     let mut data = HashMap::new();
-    let template_data = RpcTemplateData::new(&meta);
+    let template_data = RpcTemplateData::new(meta);
     data.insert("data", template_data);
-    let html = handlebars::Handlebars::new().render_template(template, &data)?;
-
-    let filename = format!("rpc-report-{}.html", meta.run_id);
     let path = reports_dir.join(filename);
-    std::fs::write(&path, html)?;
+    render_to_file(RPC_REPORT_TEMPLATE, &data, &path)?;
 
     Ok(path)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn builtin_templates_compile() {
+        for name in [REPORT_TEMPLATE, RPC_REPORT_TEMPLATE, CAMPAIGN_TEMPLATE] {
+            assert!(TEMPLATES.has_template(name), "missing template {name}");
+        }
+    }
+}
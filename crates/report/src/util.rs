@@ -41,6 +41,46 @@ pub fn std_deviation(data: &[u64]) -> Option<f64> {
     }
 }
 
+/// Returns the nearest-rank value for each of `quantiles` (ascending, in `[0, 1]`),
+/// or `None` if `data` is empty.
+///
+/// Uses successive partial selections rather than a full sort; `data` is reordered.
+pub fn nearest_rank_quantiles<T: Ord + Copy>(data: &mut [T], quantiles: &[f64]) -> Option<Vec<T>> {
+    if data.is_empty() {
+        return None;
+    }
+    let len = data.len();
+    let mut values = Vec::with_capacity(quantiles.len());
+    // everything before `lo` is <= data[lo] after each selection,
+    // so each subsequent (larger) quantile only needs to search data[lo..]
+    let mut lo = 0;
+    for &q in quantiles {
+        let idx = ((len as f64 * q).ceil() as usize)
+            .saturating_sub(1)
+            .min(len - 1);
+        debug_assert!(idx >= lo, "quantiles must be in ascending order");
+        let idx = idx.max(lo);
+        let (_, value, _) = data[lo..].select_nth_unstable(idx - lo);
+        values.push(*value);
+        lo = idx;
+    }
+    Some(values)
+}
+
+/// Counts the number of values in each `bucket_size`-wide bucket.
+/// The result is indexed by bucket, ending at the highest non-empty bucket.
+pub fn bucket_counts(values: impl IntoIterator<Item = u64>, bucket_size: u64) -> Vec<u64> {
+    let mut counts = vec![];
+    for value in values {
+        let bucket_index = (value / bucket_size) as usize;
+        if bucket_index >= counts.len() {
+            counts.resize(bucket_index + 1, 0);
+        }
+        counts[bucket_index] += 1;
+    }
+    counts
+}
+
 pub fn write_run_txs<T: std::io::Write>(writer: &mut csv::Writer<T>, txs: &[RunTx]) -> Result<()> {
     for tx in txs {
         writer.serialize(tx)?;
@@ -59,4 +99,24 @@ mod test {
         assert_eq!(abbreviate_num(1_000_000), "1.0M");
         assert_eq!(abbreviate_num(1_234_567), "1.2M");
     }
+
+    #[test]
+    fn test_nearest_rank_quantiles() {
+        let mut data: Vec<u64> = (1..=100).rev().collect();
+        assert_eq!(
+            nearest_rank_quantiles(&mut data, &[0.0, 0.5, 0.9, 0.95, 0.99, 1.0]),
+            Some(vec![1, 50, 90, 95, 99, 100])
+        );
+        assert_eq!(
+            nearest_rank_quantiles(&mut [7u64], &[0.5, 0.99]),
+            Some(vec![7, 7])
+        );
+        assert_eq!(nearest_rank_quantiles::<u64>(&mut [], &[0.5]), None);
+    }
+
+    #[test]
+    fn test_bucket_counts() {
+        assert_eq!(bucket_counts([5, 99, 100, 350], 100), vec![2, 1, 0, 1]);
+        assert!(bucket_counts([], 100).is_empty());
+    }
 }